@@ -2,43 +2,216 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 import os
+import argparse
+import pyarrow as pa
+from pyarrow import csv as pacsv
+from pyarrow import parquet as pq
+
+# Polars is optional and only imported when PolarsHRDataProcessor is used
+pl = None
+
+# Column types declared up front so the Arrow CSV reader skips type inference
+RAW_COLUMN_TYPES = {
+    'Age': 'int16',
+    'MonthlyIncome': 'float32',
+    'JobSatisfaction': 'int8',
+    'Department': 'string',
+    'Gender': 'string',
+    'JobRole': 'string'
+}
+
+# Empty fields in text columns are read as missing, as pd.read_csv does
+RAW_CONVERT_OPTIONS = pacsv.ConvertOptions(column_types=RAW_COLUMN_TYPES, strings_can_be_null=True)
+
+# Used when the declared integer columns hold float text such as '41.0', as in a
+# pandas export with gaps; they are read as float64 and later downcast. The types
+# stay explicit because a streaming reader infers them from the first block only
+TEXT_CONVERT_OPTIONS = pacsv.ConvertOptions(
+    column_types={col: 'float64' if dtype.startswith('int') else dtype
+                  for col, dtype in RAW_COLUMN_TYPES.items()},
+    strings_can_be_null=True
+)
+
+# Bytes of raw CSV parsed per block when streaming it into the Parquet cache
+CSV_BLOCK_SIZE = 64 << 20
+
+# Low-cardinality text columns stored as category codes after load
+CATEGORICAL_COLUMNS = (
+    'Department', 'Gender', 'JobRole', 'BusinessTravel',
+    'EducationField', 'MaritalStatus', 'OverTime'
+)
+
+
+def read_raw_csv(csv_path):
+    """Read a raw HR CSV file with the multi-threaded Arrow parser"""
+    try:
+        table = pacsv.read_csv(csv_path, convert_options=RAW_CONVERT_OPTIONS)
+    except pa.ArrowInvalid:
+        table = pacsv.read_csv(csv_path, convert_options=TEXT_CONVERT_OPTIONS)
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def _stream_csv_to_parquet(csv_path, parquet_path, block_size, convert_options):
+    """Convert a CSV file to Parquet one block at a time"""
+    reader = pacsv.open_csv(csv_path,
+                            read_options=pacsv.ReadOptions(block_size=block_size),
+                            convert_options=convert_options)
+    with pq.ParquetWriter(parquet_path, reader.schema, compression='snappy') as writer:
+        for batch in reader:
+            writer.write_batch(batch)
+
+
+def cache_raw_as_parquet(csv_path, block_size=CSV_BLOCK_SIZE):
+    """Cache a raw CSV file as Parquet next to it and return the cache path"""
+    parquet_path = os.path.splitext(csv_path)[0] + '.parquet'
+    
+    # Reuse the cache unless the CSV has changed since it was written
+    if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path):
+        return parquet_path
+    
+    print(f"Caching {csv_path} as Parquet...")
+    # Stream the CSV block by block so only one block is held in memory at a time.
+    # Write to a temporary file so a failed run never leaves a partial cache behind
+    tmp_path = parquet_path + '.tmp'
+    try:
+        try:
+            _stream_csv_to_parquet(csv_path, tmp_path, block_size, RAW_CONVERT_OPTIONS)
+        except pa.ArrowInvalid:
+            _stream_csv_to_parquet(csv_path, tmp_path, block_size, TEXT_CONVERT_OPTIONS)
+        os.replace(tmp_path, parquet_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return parquet_path
+
+def normalize_categories(series, mapping):
+    """Map lower-cased category labels to canonical values, keeping unmapped labels"""
+    values = series.astype('category')
+    categories = values.cat.categories
+    
+    # Only the unique labels are normalized, then the row codes are remapped
+    lowered = categories.str.lower().map(mapping)
+    remap, new_categories = lowered.where(lowered.notna(), categories).factorize()
+    codes = values.cat.codes.to_numpy()
+    # Appending -1 keeps missing rows missing, including when there are no categories at all
+    new_codes = np.append(remap, -1)[codes]
+    return pd.Series(pd.Categorical.from_codes(new_codes, categories=new_categories), index=series.index)
+
+# Below this many rows the Numba compile cost outweighs the faster bucketing
+NUMBA_MIN_ROWS = 100_000
+
+# Compiled on first use: None until then, False when numba is not installed
+_bucketize_kernel = None
+
+
+def _get_bucketize_kernel():
+    """Import numba and compile the bucketing kernel on first use"""
+    global _bucketize_kernel
+    if _bucketize_kernel is None:
+        try:
+            from numba import njit, prange
+        except ImportError:  # Numba bucketing kernel is optional
+            _bucketize_kernel = False
+            return _bucketize_kernel
+        
+        @njit(parallel=True, cache=True)
+        def kernel(values, edges, out):
+            n_bins = edges.shape[0] - 1
+            for i in prange(values.shape[0]):
+                v = values[i]
+                j = 0
+                # NaN compares false against every edge and ends up with no bin
+                while j < edges.shape[0] and v > edges[j]:
+                    j += 1
+                out[i] = j - 1 if j <= n_bins else -1
+        
+        _bucketize_kernel = kernel
+    return _bucketize_kernel
+
+
+def bucketize(values, edges, labels):
+    """Bin values into right-closed intervals like pd.cut, returning a Categorical"""
+    kernel = _get_bucketize_kernel() if len(values) >= NUMBA_MIN_ROWS else False
+    if kernel:
+        codes = np.empty(len(values), dtype=np.int8)
+        kernel(values, np.asarray(edges, dtype=np.float64), codes)
+    else:
+        codes = np.searchsorted(edges, values, side='left') - 1
+        # Values outside the edges or missing get no category, as with pd.cut
+        codes[(codes >= len(labels)) | np.isnan(values)] = -1
+    return pd.Categorical.from_codes(codes, categories=labels)
 
 class HRDataProcessor:
-    def __init__(self, input_path, output_path):
+    def __init__(self, input_path, output_path, input_format=None, write_csv=True, write_excel=False,
+                 compress_csv=False):
         self.input_path = input_path
         self.output_path = output_path
+        # Input format defaults to the file extension: csv, parquet or feather
+        self.input_format = (input_format or os.path.splitext(input_path)[1].lstrip('.')).lower()
+        self.write_csv = write_csv
+        self.write_excel = write_excel
+        self.compress_csv = compress_csv
         self.df = None
         self.original_shape = None
+        self.summary_stats = None
         self.processing_log = []
         self.start_time = datetime.now()
     
     def load_data(self):
         """Load raw HR data"""
         print("Loading HR data...")
-        self.df = pd.read_csv(self.input_path)
+        if self.input_format == 'parquet':
+            self.df = pd.read_parquet(self.input_path, engine='pyarrow', dtype_backend='pyarrow')
+        elif self.input_format == 'feather':
+            self.df = pd.read_feather(self.input_path, dtype_backend='pyarrow')
+        else:
+            self.df = read_raw_csv(self.input_path)
+        
+        self._downcast()
+        self._categorize()
+        
         self.original_shape = self.df.shape
         self.processing_log.append(f"Loaded data: {self.original_shape[0]} rows, {self.original_shape[1]} columns")
         print(f"   Loaded {self.original_shape[0]} employee records")
         return self
     
+    def _categorize(self):
+        """Store low-cardinality text columns as categories"""
+        cols = set(self.df.columns)
+        for col in CATEGORICAL_COLUMNS:
+            if col in cols:
+                self.df[col] = self.df[col].astype('category')
+    
+    def _downcast(self):
+        """Shrink numeric columns to the smallest dtype that holds their values"""
+        for col in self.df.select_dtypes('integer').columns:
+            # An all-null column has no minimum and keeps a signed type
+            lowest = self.df[col].min()
+            downcast = 'unsigned' if pd.notna(lowest) and lowest >= 0 else 'integer'
+            self.df[col] = pd.to_numeric(self.df[col], downcast=downcast)
+        
+        # Floats such as MonthlyIncome are stored as float32
+        for col in self.df.select_dtypes('floating').columns:
+            self.df[col] = pd.to_numeric(self.df[col], downcast='float')
+    
     def data_quality_assessment(self):
         """Assess data quality issues"""
         print("Assessing data quality...")
         
-        # Check for duplicates
-        duplicates = self.df.duplicated().sum()
-        self.processing_log.append(f"Found {duplicates} duplicate rows")
+        # Duplicates are counted by remove_duplicates while it drops them
         
-        # Check for missing values
-        missing_summary = self.df.isnull().sum()
-        missing_cols = missing_summary[missing_summary > 0]
+        # Check for missing values using the null counts Arrow keeps per column
+        table = pa.Table.from_pandas(self.df, preserve_index=False)
+        missing_cols = {col: column.null_count for col, column in zip(table.column_names, table.columns)
+                        if column.null_count > 0}
         
-        if not missing_cols.empty:
+        if missing_cols:
             self.processing_log.append("Missing values found:")
+            inv_n = 100.0 / len(self.df)
             for col, count in missing_cols.items():
-                self.processing_log.append(f"  - {col}: {count} missing ({count/len(self.df)*100:.1f}%)")
+                self.processing_log.append(f"  - {col}: {count} missing ({count*inv_n:.1f}%)")
         
-        print(f"   Found {duplicates} duplicates and missing values in {len(missing_cols)} columns")
+        print(f"   Found missing values in {len(missing_cols)} columns")
         return self
     
     def remove_duplicates(self):
@@ -52,92 +225,134 @@ class HRDataProcessor:
         print(f"   Removed {removed} duplicate records")
         return self
     
-    def handle_missing_values(self):
+    def transform_data(self):
+        """Fill, standardize and derive columns, assigning them to the frame in one step"""
+        cols = set(self.df.columns)
+        columns = {}
+        
+        # MonthlyIncome is carried between the steps as a single float64 array
+        if 'MonthlyIncome' in cols:
+            columns['MonthlyIncome'] = self.df['MonthlyIncome'].to_numpy(dtype='float64', na_value=np.nan, copy=True)
+        
+        self._fill_missing_values(columns, cols)
+        self._standardize_values(columns, cols)
+        self._derive_features(columns, cols)
+        
+        if 'MonthlyIncome' in cols:
+            columns['MonthlyIncome'] = pd.array(columns['MonthlyIncome'], dtype=self.df['MonthlyIncome'].dtype)
+        self.df = self.df.assign(**columns)
+        return self
+    
+    def _fill_missing_values(self, columns, cols):
         """Handle missing values with business logic"""
         print("Handling missing values...")
         
         # Handle missing MonthlyIncome - fill with median by JobRole
-        if 'MonthlyIncome' in self.df.columns:
-            missing_income = self.df['MonthlyIncome'].isnull().sum()
+        if 'MonthlyIncome' in cols:
+            income = columns['MonthlyIncome']
+            mask = np.isnan(income)
+            missing_income = mask.sum()
             if missing_income > 0:
-                # Fill with median income by job role
-                self.df['MonthlyIncome'] = self.df.groupby('JobRole')['MonthlyIncome'].transform(
-                    lambda x: x.fillna(x.median())
-                )
+                # Fill with median income by job role, computed once per role and mapped back.
+                # JobRole is categorical, so only observed roles are grouped on their integer codes
+                role_median = self.df.groupby('JobRole', observed=True, sort=False)['MonthlyIncome'].median()
+                fill = self.df['JobRole'].map(role_median).to_numpy(dtype='float64', na_value=np.nan)
+                income[mask] = fill[mask]
                 self.processing_log.append(f"Filled {missing_income} missing MonthlyIncome values using job role median")
         
         # Handle missing JobSatisfaction - fill with most common value (mode)
-        if 'JobSatisfaction' in self.df.columns:
-            missing_satisfaction = self.df['JobSatisfaction'].isnull().sum()
+        if 'JobSatisfaction' in cols:
+            satisfaction = self.df['JobSatisfaction'].to_numpy(dtype='float64', na_value=np.nan, copy=True)
+            mask = np.isnan(satisfaction)
+            missing_satisfaction = mask.sum()
             if missing_satisfaction > 0:
                 mode_satisfaction = self.df['JobSatisfaction'].mode()[0]
-                self.df['JobSatisfaction'].fillna(mode_satisfaction, inplace=True)
+                satisfaction[mask] = mode_satisfaction
+                columns['JobSatisfaction'] = pd.array(satisfaction, dtype=self.df['JobSatisfaction'].dtype)
                 self.processing_log.append(f"Filled {missing_satisfaction} missing JobSatisfaction values with mode ({mode_satisfaction})")
         
         print(f"   Missing values handled using business logic")
-        return self
     
-    def standardize_data(self):
+    def _standardize_values(self, columns, cols):
         """Standardize data formats and values"""
         print("Standardizing data formats...")
         
         # Standardize Department names
-        if 'Department' in self.df.columns:
+        if 'Department' in cols:
             # Convert to proper case and fix inconsistencies
             dept_mapping = {
-                'SALES': 'Sales',
                 'sales': 'Sales',
-                'RESEARCH & DEVELOPMENT': 'Research & Development',
                 'research & development': 'Research & Development',
-                'HUMAN RESOURCES': 'Human Resources',
                 'human resources': 'Human Resources'
             }
-            self.df['Department'] = self.df['Department'].replace(dept_mapping)
+            columns['Department'] = normalize_categories(self.df['Department'], dept_mapping)
             self.processing_log.append("Standardized Department names")
         
         # Standardize Gender values
-        if 'Gender' in self.df.columns:
+        if 'Gender' in cols:
             gender_mapping = {
-                'M': 'Male',
-                'F': 'Female',
                 'm': 'Male',
                 'f': 'Female'
             }
-            self.df['Gender'] = self.df['Gender'].replace(gender_mapping)
+            columns['Gender'] = normalize_categories(self.df['Gender'], gender_mapping)
             self.processing_log.append("Standardized Gender values")
         
         # Ensure MonthlyIncome is positive
-        if 'MonthlyIncome' in self.df.columns:
-            negative_incomes = (self.df['MonthlyIncome'] < 0).sum()
+        if 'MonthlyIncome' in cols:
+            income = columns['MonthlyIncome']
+            negative_incomes = (income < 0).sum()
             if negative_incomes > 0:
-                self.df['MonthlyIncome'] = self.df['MonthlyIncome'].abs()
+                np.abs(income, out=income)
                 self.processing_log.append(f"Fixed {negative_incomes} negative income values")
         
         print("   Data formats standardized")
-        return self
     
-    def create_derived_features(self):
+    def _derive_features(self, columns, cols):
         """Create useful derived features"""
         print("Creating derived features...")
         
         # Create age groups
-        if 'Age' in self.df.columns:
-            self.df['AgeGroup'] = pd.cut(self.df['Age'], 
-                                       bins=[0, 30, 40, 50, 100], 
-                                       labels=['Under 30', '30-40', '40-50', '50+'])
+        if 'Age' in cols:
+            ages = self.df['Age'].to_numpy(dtype='float64', na_value=np.nan)
+            columns['AgeGroup'] = bucketize(ages, np.array([0, 30, 40, 50, 100]),
+                                            ['Under 30', '30-40', '40-50', '50+'])
             self.processing_log.append("Created AgeGroup categories")
         
         # Create income categories
-        if 'MonthlyIncome' in self.df.columns:
-            income_quartiles = self.df['MonthlyIncome'].quantile([0.25, 0.5, 0.75])
-            self.df['IncomeCategory'] = pd.cut(self.df['MonthlyIncome'],
-                                             bins=[0, income_quartiles[0.25], income_quartiles[0.5], 
-                                                   income_quartiles[0.75], float('inf')],
-                                             labels=['Low', 'Medium', 'High', 'Very High'])
+        if 'MonthlyIncome' in cols:
+            income = columns['MonthlyIncome']
+            income_quartiles = np.nanquantile(income, [0.25, 0.5, 0.75])
+            columns['IncomeCategory'] = bucketize(income, np.concatenate(([0], income_quartiles, [np.inf])),
+                                                  ['Low', 'Medium', 'High', 'Very High'])
             self.processing_log.append("Created IncomeCategory based on quartiles")
         
         print("   Derived features created")
-        return self
+    
+    def _summary_statistics(self):
+        """Compute the statistics shared by the summary table and the report in one pass"""
+        if self.summary_stats is None:
+            cols = set(self.df.columns)
+            stats = {}
+            if 'Age' in cols:
+                stats['age_mean'] = np.nanmean(self.df['Age'].to_numpy(dtype='float64', na_value=np.nan))
+            if 'MonthlyIncome' in cols:
+                # Pull the income array once and compute every statistic from it
+                income = self.df['MonthlyIncome'].to_numpy(dtype='float64', na_value=np.nan)
+                stats['income_mean'] = np.nanmean(income)
+                stats['income_median'] = np.nanmedian(income)
+                stats['income_min'] = np.nanmin(income)
+                stats['income_max'] = np.nanmax(income)
+                stats['income_std'] = np.nanstd(income, ddof=1)
+            if 'Department' in cols:
+                dept_counts = self.df['Department'].value_counts()
+                stats['department_counts'] = dept_counts[dept_counts > 0]
+                # Percentages of all employees, computed for every department in one vectorized step
+                stats['department_percents'] = stats['department_counts'].mul(100.0 / len(self.df))
+                stats['departments'] = len(stats['department_counts'])
+            if 'JobRole' in cols:
+                stats['job_roles'] = self.df['JobRole'].nunique()
+            self.summary_stats = stats
+        return self.summary_stats
     
     def save_processed_data(self):
         """Save the cleaned dataset"""
@@ -146,30 +361,54 @@ class HRDataProcessor:
         # Ensure output directory exists
         os.makedirs(os.path.dirname(self.output_path), exist_ok=True)
         
-        # Save to CSV
-        self.df.to_csv(self.output_path, index=False)
-        self.processing_log.append(f"Cleaned data saved to {self.output_path}")
-        
-        # Also save as Excel with multiple sheets
-        excel_path = self.output_path.replace('.csv', '.xlsx')
-        with pd.ExcelWriter(excel_path, engine='openpyxl') as writer:
-            self.df.to_excel(writer, sheet_name='CleanData', index=False)
-            
-            # Create summary sheet
-            summary_df = pd.DataFrame({
-                'Metric': ['Total Records', 'Total Columns', 'Departments', 'Job Roles', 'Avg Age', 'Avg Monthly Income'],
-                'Value': [
-                    len(self.df),
-                    len(self.df.columns),
-                    self.df['Department'].nunique() if 'Department' in self.df.columns else 'N/A',
-                    self.df['JobRole'].nunique() if 'JobRole' in self.df.columns else 'N/A',
-                    f"{self.df['Age'].mean():.1f}" if 'Age' in self.df.columns else 'N/A',
-                    f"${self.df['MonthlyIncome'].mean():,.0f}" if 'MonthlyIncome' in self.df.columns else 'N/A'
-                ]
-            })
-            summary_df.to_excel(writer, sheet_name='Summary', index=False)
-        
-        print(f"   Saved clean data ({len(self.df)} rows) to CSV and Excel")
+        # Save to Parquet
+        parquet_path = self.output_path.replace('.csv', '.parquet')
+        self.df.to_parquet(parquet_path, engine='pyarrow', compression='snappy', index=False)
+        self.processing_log.append(f"Cleaned data saved to {parquet_path}")
+        
+        # Save to CSV for backwards compatibility, using the multi-threaded Arrow writer
+        if self.write_csv:
+            table = pa.Table.from_pandas(self.df, preserve_index=False)
+            if self.compress_csv:
+                csv_path = self.output_path + '.gz'
+                with pa.CompressedOutputStream(csv_path, 'gzip') as stream:
+                    pacsv.write_csv(table, stream)
+            else:
+                csv_path = self.output_path
+                pacsv.write_csv(table, csv_path)
+            self.processing_log.append(f"Cleaned data saved to {csv_path}")
+        
+        # Create summary table
+        n = len(self.df)
+        cols = set(self.df.columns)
+        stats = self._summary_statistics()
+        summary_df = pd.DataFrame({
+            'Metric': ['Total Records', 'Total Columns', 'Departments', 'Job Roles', 'Avg Age', 'Avg Monthly Income'],
+            'Value': [
+                n,
+                len(cols),
+                stats['departments'] if 'Department' in cols else 'N/A',
+                stats['job_roles'] if 'JobRole' in cols else 'N/A',
+                f"{stats['age_mean']:.1f}" if 'Age' in cols else 'N/A',
+                f"${stats['income_mean']:,.0f}" if 'MonthlyIncome' in cols else 'N/A'
+            ]
+        })
+        summary_path = self.output_path.replace('.csv', '_summary.csv')
+        summary_df.to_csv(summary_path, index=False)
+        self.processing_log.append(f"Summary saved to {summary_path}")
+        
+        # Optionally save as Excel with multiple sheets
+        if self.write_excel:
+            excel_path = self.output_path.replace('.csv', '.xlsx')
+            # constant_memory mode is not used: pandas writes cells column by column
+            with pd.ExcelWriter(excel_path, engine='xlsxwriter') as writer:
+                self.df.to_excel(writer, sheet_name='CleanData', index=False)
+                summary_df.to_excel(writer, sheet_name='Summary', index=False)
+            self.processing_log.append(f"Excel workbook saved to {excel_path}")
+        
+        formats = ', '.join(name for name, enabled in
+                            (('Parquet', True), ('CSV', self.write_csv), ('Excel', self.write_excel)) if enabled)
+        print(f"   Saved clean data ({n} rows) to {formats}")
         return self
     
     def generate_processing_report(self):
@@ -182,83 +421,283 @@ class HRDataProcessor:
         report_path = 'reports/hr_data_processing_report.txt'
         os.makedirs('reports', exist_ok=True)
         
-        with open(report_path, 'w') as f:
-            f.write("HR DATA PROCESSING AUTOMATION REPORT\n")
-            f.write("=" * 50 + "\n\n")
-            
-            f.write(f"Processing Date: {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Processing Time: {processing_time:.2f} seconds\n")
-            f.write(f"Input File: {self.input_path}\n")
-            f.write(f"Output File: {self.output_path}\n\n")
-            
-            f.write("DATA TRANSFORMATION SUMMARY:\n")
-            f.write("-" * 30 + "\n")
-            f.write(f"Original Shape: {self.original_shape[0]} rows × {self.original_shape[1]} columns\n")
-            f.write(f"Final Shape: {self.df.shape[0]} rows × {self.df.shape[1]} columns\n")
-            f.write(f"Rows Processed: {self.original_shape[0]}\n")
-            f.write(f"Rows Retained: {self.df.shape[0]}\n")
-            f.write(f"Data Quality Improvement: {((self.df.shape[0]/self.original_shape[0])*100):.1f}% clean data retention\n\n")
-            
-            f.write("PROCESSING STEPS COMPLETED:\n")
-            f.write("-" * 30 + "\n")
-            for i, step in enumerate(self.processing_log, 1):
-                f.write(f"{i}. {step}\n")
-            f.write("\n")
-            
-            # Add data insights
-            if 'Department' in self.df.columns:
-                f.write("DEPARTMENT DISTRIBUTION:\n")
-                f.write("-" * 25 + "\n")
-                dept_counts = self.df['Department'].value_counts()
-                for dept, count in dept_counts.items():
-                    f.write(f"• {dept}: {count} employees ({count/len(self.df)*100:.1f}%)\n")
-                f.write("\n")
-            
-            if 'MonthlyIncome' in self.df.columns:
-                f.write("SALARY STATISTICS:\n")
-                f.write("-" * 18 + "\n")
-                f.write(f"• Average Salary: ${self.df['MonthlyIncome'].mean():,.2f}\n")
-                f.write(f"• Median Salary: ${self.df['MonthlyIncome'].median():,.2f}\n")
-                f.write(f"• Salary Range: ${self.df['MonthlyIncome'].min():,.2f} - ${self.df['MonthlyIncome'].max():,.2f}\n")
-                f.write(f"• Standard Deviation: ${self.df['MonthlyIncome'].std():,.2f}\n\n")
-            
-            f.write("EFFICIENCY METRICS:\n")
-            f.write("-" * 20 + "\n")
-            f.write(f"• Processing Speed: {self.original_shape[0]/processing_time:.0f} records/second\n")
-            f.write(f"• Time Savings vs Manual: ~{(2*3600-processing_time)/3600:.1f} hours saved\n")
-            f.write(f"• Estimated Manual Time: ~2 hours\n")
-            f.write(f"• Automated Time: {processing_time:.1f} seconds\n")
-            f.write(f"• Efficiency Gain: {((2*3600)/processing_time):.0f}x faster\n")
+        n, n_cols = self.df.shape
+        cols = set(self.df.columns)
+        
+        # Build the whole report in memory and write it with a single buffered call
+        parts = []
+        parts.append("HR DATA PROCESSING AUTOMATION REPORT\n")
+        parts.append("=" * 50 + "\n\n")
+        
+        parts.append(f"Processing Date: {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+        parts.append(f"Processing Time: {processing_time:.2f} seconds\n")
+        parts.append(f"Input File: {self.input_path}\n")
+        parts.append(f"Output File: {self.output_path}\n\n")
+        
+        parts.append("DATA TRANSFORMATION SUMMARY:\n")
+        parts.append("-" * 30 + "\n")
+        parts.append(f"Original Shape: {self.original_shape[0]} rows × {self.original_shape[1]} columns\n")
+        parts.append(f"Final Shape: {n} rows × {n_cols} columns\n")
+        parts.append(f"Rows Processed: {self.original_shape[0]}\n")
+        parts.append(f"Rows Retained: {n}\n")
+        parts.append(f"Data Quality Improvement: {((n/self.original_shape[0])*100):.1f}% clean data retention\n\n")
+        
+        parts.append("PROCESSING STEPS COMPLETED:\n")
+        parts.append("-" * 30 + "\n")
+        for i, step in enumerate(self.processing_log, 1):
+            parts.append(f"{i}. {step}\n")
+        parts.append("\n")
+        
+        # Add data insights
+        stats = self._summary_statistics()
+        if 'Department' in cols:
+            parts.append("DEPARTMENT DISTRIBUTION:\n")
+            parts.append("-" * 25 + "\n")
+            dept_counts = stats['department_counts']
+            dept_percents = stats['department_percents']
+            for dept, count in dept_counts.items():
+                parts.append(f"• {dept}: {count} employees ({dept_percents[dept]:.1f}%)\n")
+            parts.append("\n")
+        
+        if 'MonthlyIncome' in cols:
+            parts.append("SALARY STATISTICS:\n")
+            parts.append("-" * 18 + "\n")
+            parts.append(f"• Average Salary: ${stats['income_mean']:,.2f}\n")
+            parts.append(f"• Median Salary: ${stats['income_median']:,.2f}\n")
+            parts.append(f"• Salary Range: ${stats['income_min']:,.2f} - ${stats['income_max']:,.2f}\n")
+            parts.append(f"• Standard Deviation: ${stats['income_std']:,.2f}\n\n")
+        
+        parts.append("EFFICIENCY METRICS:\n")
+        parts.append("-" * 20 + "\n")
+        parts.append(f"• Processing Speed: {self.original_shape[0]/processing_time:.0f} records/second\n")
+        parts.append(f"• Time Savings vs Manual: ~{(2*3600-processing_time)/3600:.1f} hours saved\n")
+        parts.append(f"• Estimated Manual Time: ~2 hours\n")
+        parts.append(f"• Automated Time: {processing_time:.1f} seconds\n")
+        parts.append(f"• Efficiency Gain: {((2*3600)/processing_time):.0f}x faster\n")
+        
+        with open(report_path, 'w', buffering=1 << 16) as f:
+            f.write(''.join(parts))
         
         print(f"   Comprehensive report saved to {report_path}")
         return self
 
+class PolarsHRDataProcessor(HRDataProcessor):
+    """HR data processor running the cleaning stages on a multi-threaded Polars frame
+    
+    The frame is converted to pandas with the same compact dtypes in
+    save_processed_data, so the saved outputs and the processing report match
+    HRDataProcessor.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        global pl
+        try:
+            import polars as pl
+        except ImportError:
+            raise ImportError("The Polars engine requires the 'polars' package") from None
+        super().__init__(*args, **kwargs)
+    
+    def load_data(self):
+        """Load raw HR data"""
+        print("Loading HR data...")
+        if self.input_format == 'parquet':
+            self.df = pl.read_parquet(self.input_path)
+        elif self.input_format == 'feather':
+            self.df = pl.read_ipc(self.input_path)
+        else:
+            self.df = pl.read_csv(self.input_path)
+        self.original_shape = self.df.shape
+        self.processing_log.append(f"Loaded data: {self.original_shape[0]} rows, {self.original_shape[1]} columns")
+        print(f"   Loaded {self.original_shape[0]} employee records")
+        return self
+    
+    def data_quality_assessment(self):
+        """Assess data quality issues"""
+        print("Assessing data quality...")
+        
+        # Duplicates are counted by remove_duplicates while it drops them
+        
+        # Check for missing values
+        missing_summary = self.df.null_count().row(0, named=True)
+        missing_cols = {col: count for col, count in missing_summary.items() if count > 0}
+        
+        if missing_cols:
+            self.processing_log.append("Missing values found:")
+            inv_n = 100.0 / self.df.height
+            for col, count in missing_cols.items():
+                self.processing_log.append(f"  - {col}: {count} missing ({count*inv_n:.1f}%)")
+        
+        print(f"   Found missing values in {len(missing_cols)} columns")
+        return self
+    
+    def remove_duplicates(self):
+        """Remove duplicate records"""
+        print("Removing duplicates...")
+        initial_count = self.df.height
+        self.df = self.df.unique(maintain_order=True)
+        removed = initial_count - self.df.height
+        
+        self.processing_log.append(f"Removed {removed} duplicate rows")
+        print(f"   Removed {removed} duplicate records")
+        return self
+    
+    def transform_data(self):
+        """Fill, standardize and derive columns"""
+        return self.handle_missing_values() \
+                   .standardize_data() \
+                   .create_derived_features()
+    
+    def handle_missing_values(self):
+        """Handle missing values with business logic"""
+        print("Handling missing values...")
+        cols = set(self.df.columns)
+        
+        # Handle missing MonthlyIncome - fill with median by JobRole
+        if 'MonthlyIncome' in cols:
+            missing_income = self.df['MonthlyIncome'].null_count()
+            if missing_income > 0:
+                self.df = self.df.with_columns(
+                    pl.col('MonthlyIncome').fill_null(pl.col('MonthlyIncome').median().over('JobRole'))
+                )
+                self.processing_log.append(f"Filled {missing_income} missing MonthlyIncome values using job role median")
+        
+        # Handle missing JobSatisfaction - fill with most common value (mode)
+        if 'JobSatisfaction' in cols:
+            missing_satisfaction = self.df['JobSatisfaction'].null_count()
+            if missing_satisfaction > 0:
+                # Sort so ties resolve to the smallest value, as in pandas
+                mode_satisfaction = self.df['JobSatisfaction'].drop_nulls().mode().sort()[0]
+                self.df = self.df.with_columns(pl.col('JobSatisfaction').fill_null(mode_satisfaction))
+                self.processing_log.append(f"Filled {missing_satisfaction} missing JobSatisfaction values with mode ({mode_satisfaction})")
+        
+        print(f"   Missing values handled using business logic")
+        return self
+    
+    def standardize_data(self):
+        """Standardize data formats and values"""
+        print("Standardizing data formats...")
+        cols = set(self.df.columns)
+        
+        # Standardize Department names
+        if 'Department' in cols:
+            dept_mapping = {
+                'sales': 'Sales',
+                'research & development': 'Research & Development',
+                'human resources': 'Human Resources'
+            }
+            self.df = self.df.with_columns(self._normalize_labels('Department', dept_mapping))
+            self.processing_log.append("Standardized Department names")
+        
+        # Standardize Gender values
+        if 'Gender' in cols:
+            gender_mapping = {
+                'm': 'Male',
+                'f': 'Female'
+            }
+            self.df = self.df.with_columns(self._normalize_labels('Gender', gender_mapping))
+            self.processing_log.append("Standardized Gender values")
+        
+        # Ensure MonthlyIncome is positive
+        if 'MonthlyIncome' in cols:
+            negative_incomes = (self.df['MonthlyIncome'] < 0).sum()
+            if negative_incomes > 0:
+                self.df = self.df.with_columns(pl.col('MonthlyIncome').abs())
+                self.processing_log.append(f"Fixed {negative_incomes} negative income values")
+        
+        print("   Data formats standardized")
+        return self
+    
+    def create_derived_features(self):
+        """Create useful derived features"""
+        print("Creating derived features...")
+        cols = set(self.df.columns)
+        
+        # Create age groups
+        if 'Age' in cols:
+            ages = self.df['Age'].cast(pl.Float64).to_numpy()
+            self.df = self.df.with_columns(self._bucket_series('AgeGroup', ages, np.array([0, 30, 40, 50, 100]),
+                                                               ['Under 30', '30-40', '40-50', '50+']))
+            self.processing_log.append("Created AgeGroup categories")
+        
+        # Create income categories
+        if 'MonthlyIncome' in cols:
+            income = self.df['MonthlyIncome'].cast(pl.Float64).to_numpy()
+            income_quartiles = np.nanquantile(income, [0.25, 0.5, 0.75])
+            self.df = self.df.with_columns(self._bucket_series('IncomeCategory', income,
+                                                               np.concatenate(([0], income_quartiles, [np.inf])),
+                                                               ['Low', 'Medium', 'High', 'Very High']))
+            self.processing_log.append("Created IncomeCategory based on quartiles")
+        
+        print("   Derived features created")
+        return self
+    
+    @staticmethod
+    def _normalize_labels(col, mapping):
+        """Map lower-cased labels to canonical values like normalize_categories, keeping unmapped labels"""
+        return pl.col(col).str.to_lowercase().replace_strict(mapping, default=pl.col(col), return_dtype=pl.String)
+    
+    @staticmethod
+    def _bucket_series(name, values, edges, labels):
+        """Bin values with the same edges and NaN rules as the pandas engine, as a Polars Enum"""
+        codes = bucketize(values, edges, labels).codes
+        return pl.Series(name, codes).replace_strict(dict(enumerate(labels)), default=None,
+                                                     return_dtype=pl.Enum(labels))
+    
+    def save_processed_data(self):
+        """Save the cleaned dataset"""
+        # Hand the frame back to pandas for the writers and the report, with the
+        # Arrow-backed, downcast and categorical dtypes the pandas engine produces
+        enum_categories = {col: dtype.categories.to_list() for col, dtype in self.df.schema.items()
+                           if isinstance(dtype, pl.Enum)}
+        table = self.df.with_columns(pl.col(list(enum_categories)).cast(pl.String)).to_arrow()
+        table = table.cast(pa.schema([pa.field(field.name, pa.string()) if field.type == pa.large_string() else field
+                                      for field in table.schema]))
+        self.df = table.to_pandas(types_mapper=pd.ArrowDtype)
+        for col, categories in enum_categories.items():
+            self.df[col] = pd.Categorical(self.df[col], categories=categories)
+        self._downcast()
+        self._categorize()
+        return super().save_processed_data()
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="HR Data Processing Automation")
+    parser.add_argument('--engine', choices=['pandas', 'polars'], default='pandas',
+                        help="dataframe engine used for the cleaning stages")
+    parser.add_argument('--excel', action='store_true',
+                        help="also write the cleaned data and summary as an Excel workbook")
+    return parser.parse_args()
+
 def main():
     """Main execution function"""
+    args = parse_args()
     print("Starting HR Data Processing Automation...")
     print("-" * 50)
     
-    # Initialize processor
-    processor = HRDataProcessor(
-        input_path='data/raw/hr_data_raw.csv',
-        output_path='data/processed/hr_data_clean.csv'
+    # Initialize processor, reading the raw data from its Parquet cache
+    processor_class = PolarsHRDataProcessor if args.engine == 'polars' else HRDataProcessor
+    processor = processor_class(
+        input_path=cache_raw_as_parquet('data/raw/hr_data_raw.csv'),
+        output_path='data/processed/hr_data_clean.csv',
+        write_excel=args.excel
     )
     
     # Execute processing pipeline
     processor.load_data() \
              .data_quality_assessment() \
              .remove_duplicates() \
-             .handle_missing_values() \
-             .standardize_data() \
-             .create_derived_features() \
+             .transform_data() \
              .save_processed_data() \
              .generate_processing_report()
     
     print("-" * 50)
     print("HR Data Processing Complete!")
     print("\nOutputs generated:")
+    print("• Clean Parquet: data/processed/hr_data_clean.parquet")
     print("• Clean CSV: data/processed/hr_data_clean.csv")
-    print("• Excel file: data/processed/hr_data_clean.xlsx")
+    print("• Summary CSV: data/processed/hr_data_clean_summary.csv")
+    if args.excel:
+        print("• Excel file: data/processed/hr_data_clean.xlsx")
     print("• Processing report: reports/hr_data_processing_report.txt")
 
 if __name__ == "__main__":